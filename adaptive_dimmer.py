@@ -4,13 +4,19 @@ from mss import mss
 import win32gui
 import win32con
 import win32api
+import win32event
+try:
+    import win32ui
+except ImportError:
+    win32ui = None
 import sys
 import ctypes
+from ctypes import wintypes
 import threading
+import queue
 import tkinter as tk
 from tkinter import scrolledtext, ttk
-import logging
-from io import StringIO
+import traceback
 from datetime import datetime
 
 # Parameters
@@ -18,80 +24,398 @@ THRESHOLD_START = 25
 THRESHOLD_MAX = 100
 MAX_OPACITY = 240
 CHECK_INTERVAL = 0.05
+SAMPLE_STRIDE = 8  # only every Nth pixel is used for the brightness average
+DEBUG_LOGGING = False
 
-class LogCapture:
-    """Captures log messages and sends them to GUI"""
-    def __init__(self, text_widget):
-        self.text_widget = text_widget
-        self.text_widget.config(state=tk.DISABLED)
-    
-    def write(self, message):
-        if message.strip():
-            self.text_widget.config(state=tk.NORMAL)
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            self.text_widget.insert(tk.END, f"[{timestamp}] {message}\n")
-            self.text_widget.see(tk.END)
-            self.text_widget.config(state=tk.DISABLED)
-    
-    def flush(self):
-        pass
+_THRESHOLD_RANGE_INV = 1.0 / (THRESHOLD_MAX - THRESHOLD_START)
+_INV255 = 1.0 / 255.0
+
+# Brightness (0..255) -> target opacity, tabulated once; the clipped-linear
+# map only has 256 distinct inputs, so per-tick arithmetic becomes a lookup
+_OPACITY_LUT = (np.clip(
+    (np.arange(256) - THRESHOLD_START) * _THRESHOLD_RANGE_INV, 0.0, 1.0
+) * MAX_OPACITY).astype(np.float32)
+
+# Target size for the GDI capture path: the screen is downscaled by the
+# driver during the blit, so only this many pixels ever reach Python
+_GDI_W = 240
+_GDI_H = 135
+
+# Upper bound for mss monitor ids; they are small dense integers, so opacity
+# state lives in flat arrays indexed by id instead of dicts
+_MAX_MONITORS = 16
+
+# Pre-bound user32 entry point for the per-frame alpha update; pywin32's
+# wrapper re-marshals its arguments generically on every call
+_user32 = ctypes.WinDLL('user32', use_last_error=True)
+_SetLayeredWindowAttributes = _user32.SetLayeredWindowAttributes
+_SetLayeredWindowAttributes.argtypes = [wintypes.HWND, wintypes.COLORREF,
+                                        wintypes.BYTE, wintypes.DWORD]
+_SetLayeredWindowAttributes.restype = wintypes.BOOL
+
+# Overlay window styles, OR'd once at import instead of per CreateWindowEx
+_OVERLAY_EX = (win32con.WS_EX_LAYERED | win32con.WS_EX_TRANSPARENT |
+               win32con.WS_EX_TOPMOST | win32con.WS_EX_NOACTIVATE)
+_OVERLAY_STYLE = win32con.WS_POPUP | win32con.WS_VISIBLE
+_SWP_FLAGS = win32con.SWP_NOACTIVATE | win32con.SWP_SHOWWINDOW
+
+# Window class names that have already been registered with Windows; class
+# registration is per-process, so re-registering on every overlay rebuild
+# just raises ERROR_CLASS_ALREADY_EXISTS
+_registered_classes = set()
+
+# Optional: Numba fuses the per-pixel BGR reduction into one native pass
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(parallel=True, cache=True, fastmath=True)
+    def _luma_bgr(sub):
+        # ITU-R BT.601 luma, scaled to integer weights so the accumulation
+        # stays in integer registers (0.114 B + 0.587 G + 0.299 R)
+        h, w = sub.shape[0], sub.shape[1]
+        total = 0.0
+        for i in prange(h):
+            s = 0
+            for j in range(w):
+                s += (114 * int(sub[i, j, 0]) + 587 * int(sub[i, j, 1])
+                      + 299 * int(sub[i, j, 2]))
+            total += s
+        return total / (1000.0 * h * w)
+else:
+    def _luma_bgr(sub):
+        # Per-channel integer sums stay much tighter than NumPy's float mean
+        # path (no 8x upcast of the whole array); BT.601 weights applied to
+        # the three scalars afterwards
+        b = sub[:, :, 0].sum(dtype=np.uint64)
+        g = sub[:, :, 1].sum(dtype=np.uint64)
+        r = sub[:, :, 2].sum(dtype=np.uint64)
+        n = sub.shape[0] * sub.shape[1]
+        return (114 * int(b) + 587 * int(g) + 299 * int(r)) / (1000.0 * n)
 
 class AdaptiveDimmer:
     def __init__(self, gui=None):
         self.hwnds = {}
         self.running = True
         self.paused = False
-        self.current_opacity = {}
-        self.target_opacity = {}
+        self.current_opacity = np.zeros(_MAX_MONITORS, dtype=np.float32)
+        self.target_opacity = np.zeros(_MAX_MONITORS, dtype=np.float32)
+        # Last alpha byte actually handed to Windows, -1 = never applied
+        self._last_alpha = np.full(_MAX_MONITORS, -1, dtype=np.int32)
         self.gui = gui
         self.active_monitors = [1]
         self.monitor_lock = threading.Lock()
         self.switching_monitor = False
-        
+        self._tls = threading.local()
+        self._last_brightness = {}
+        self._last_commanded = {}
+        self._mon_slices = None
+        # Set on WM_DISPLAYCHANGE; the monitor thread recreates its
+        # thread-local mss instance on the next tick
+        self._geometry_dirty = False
+        self._interval = CHECK_INTERVAL
+        self._gdi_res = None
+        self._status_prefix = {}
+        self._monitor_cache = None
+        # Keeps the wndProc closures alive for the lifetime of their classes
+        self._wndprocs = {}
+        # Written by the monitor thread, read by the GUI thread via polling;
+        # a plain tuple swap is atomic under the GIL
+        self.latest_status = None
+        self._log_q = queue.Queue()
+        self._log_thread = threading.Thread(target=self._log_worker, daemon=True)
+        self._log_thread.start()
+
+    def _get_sct(self):
+        """Returns a per-thread mss instance (mss is not thread-safe)"""
+        sct = getattr(self._tls, 'sct', None)
+        if sct is None:
+            sct = mss()
+            self._tls.sct = sct
+        return sct
+
+    def _close_sct(self):
+        """Closes the calling thread's cached mss instance, if any"""
+        sct = getattr(self._tls, 'sct', None)
+        if sct is not None:
+            self._tls.sct = None
+            try:
+                sct.close()
+            except Exception:
+                pass
+
     def log(self, message):
-        """Log message to console and GUI if available"""
-        print(message)
-        if self.gui:
-            self.gui.add_log(message)
-        
+        """Queue a log message; a background thread does the actual I/O"""
+        self._log_q.put_nowait(message)
+
+    def close_log(self):
+        """Flushes pending log messages and stops the writer thread"""
+        self._log_q.put_nowait(None)
+        self._log_thread.join(timeout=1)
+
+    def _log_worker(self):
+        """Drains queued log messages so console I/O never stalls the monitor thread"""
+        while True:
+            message = self._log_q.get()
+            if message is None:
+                break
+            try:
+                print(message)
+                if self.gui:
+                    self.gui.add_log(message)
+            except Exception:
+                pass
+
+    def _enum_monitors(self):
+        """Builds mss-style geometry dicts straight from the Win32 display API.
+
+        Index 0 is the virtual desktop, then one entry per monitor in
+        EnumDisplayMonitors order (the same order mss uses), so the ids stay
+        interchangeable with the capture paths. Avoids spinning up a throwaway
+        mss instance just to read coordinates.
+        """
+        try:
+            monitors = [{
+                'left': win32api.GetSystemMetrics(win32con.SM_XVIRTUALSCREEN),
+                'top': win32api.GetSystemMetrics(win32con.SM_YVIRTUALSCREEN),
+                'width': win32api.GetSystemMetrics(win32con.SM_CXVIRTUALSCREEN),
+                'height': win32api.GetSystemMetrics(win32con.SM_CYVIRTUALSCREEN),
+            }]
+            for hmon, _hdc, _rect in win32api.EnumDisplayMonitors(None, None):
+                left, top, right, bottom = win32api.GetMonitorInfo(hmon)['Monitor']
+                monitors.append({'left': left, 'top': top,
+                                 'width': right - left, 'height': bottom - top})
+            return monitors
+        except Exception:
+            with mss() as sct:
+                return list(sct.monitors)
+
+    def _get_monitor_info(self, monitor_id):
+        """Returns the cached geometry dict for a monitor, or None if unknown"""
+        if self._monitor_cache is None:
+            self._monitor_cache = self._enum_monitors()
+        cache = self._monitor_cache
+        if monitor_id < len(cache):
+            return cache[monitor_id]
+        return None
+
+    def invalidate_monitors(self):
+        """Drops cached display geometry after a WM_DISPLAYCHANGE"""
+        self._monitor_cache = None
+        self._mon_slices = None
+        # The monitor thread's mss instance caches its .monitors list at
+        # construction and is thread-local, so it can't be closed from the
+        # window thread; flag it for recreation instead
+        self._geometry_dirty = True
+
+    def _grab_small_gdi(self, monitor):
+        """Captures a monitor rect downscaled by the driver via StretchBlt.
+
+        Returns a small BGRA ndarray, or None if the GDI path is unavailable;
+        the DCs and target bitmap are created once and reused.
+        """
+        if win32ui is None:
+            return None
+        try:
+            if self._gdi_res is None:
+                hdc_screen = win32gui.GetDC(0)
+                src_dc = mem_dc = bmp = old_bmp = None
+                try:
+                    src_dc = win32ui.CreateDCFromHandle(hdc_screen)
+                    mem_dc = src_dc.CreateCompatibleDC()
+                    bmp = win32ui.CreateBitmap()
+                    bmp.CreateCompatibleBitmap(src_dc, _GDI_W, _GDI_H)
+                    old_bmp = mem_dc.SelectObject(bmp)
+                    win32gui.SetStretchBltMode(mem_dc.GetSafeHdc(), win32con.HALFTONE)
+                except Exception:
+                    # Free whatever was created before the failure, otherwise
+                    # a deterministic init error leaks the screen DC per tick
+                    self._free_gdi(hdc_screen, src_dc, mem_dc, bmp, old_bmp)
+                    raise
+                self._gdi_res = (hdc_screen, src_dc, mem_dc, bmp, old_bmp)
+
+            _, src_dc, mem_dc, bmp, _ = self._gdi_res
+            mem_dc.StretchBlt(
+                (0, 0), (_GDI_W, _GDI_H),
+                src_dc,
+                (monitor['left'], monitor['top']), (monitor['width'], monitor['height']),
+                win32con.SRCCOPY
+            )
+            buf = bmp.GetBitmapBits(True)
+            return np.frombuffer(buf, dtype=np.uint8).reshape(_GDI_H, _GDI_W, 4)
+        except Exception:
+            self._release_gdi()
+            return None
+
+    @staticmethod
+    def _free_gdi(hdc_screen, src_dc, mem_dc, bmp, old_bmp):
+        """Frees a (possibly partial) set of GDI capture resources"""
+        # Deselect the bitmap first: DeleteObject fails silently while the
+        # bitmap is still selected into the memory DC
+        if mem_dc is not None and old_bmp is not None:
+            try:
+                mem_dc.SelectObject(old_bmp)
+            except Exception:
+                pass
+        if bmp is not None:
+            try:
+                win32gui.DeleteObject(bmp.GetHandle())
+            except Exception:
+                pass
+        if mem_dc is not None:
+            try:
+                mem_dc.DeleteDC()
+            except Exception:
+                pass
+        if src_dc is not None:
+            try:
+                src_dc.DeleteDC()
+            except Exception:
+                pass
+        try:
+            win32gui.ReleaseDC(0, hdc_screen)
+        except Exception:
+            pass
+
+    def _release_gdi(self):
+        """Frees the cached GDI capture resources"""
+        res = self._gdi_res
+        self._gdi_res = None
+        if res is not None:
+            self._free_gdi(*res)
+
     def measure_brightness(self, monitor_id):
         """Measures the average screen brightness for a specific monitor"""
         try:
-            with mss() as sct:
-                if monitor_id < len(sct.monitors):
-                    monitor = sct.monitors[monitor_id]
-                else:
-                    monitor = sct.monitors[1]
-                
-                img = np.array(sct.grab(monitor))
-                gray = np.mean(img[:, :, :3], axis=2)
-                brightness = np.mean(gray)
-                return brightness
+            sct = self._get_sct()
+            if monitor_id < len(sct.monitors):
+                monitor = sct.monitors[monitor_id]
+            else:
+                monitor = sct.monitors[1]
+
+            small = self._grab_small_gdi(monitor)
+            if small is not None:
+                return float(_luma_bgr(small[:, :, :3]))
+
+            shot = sct.grab(monitor)
+            img = np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+            sub = img[::SAMPLE_STRIDE, ::SAMPLE_STRIDE, :3]
+            brightness = float(_luma_bgr(sub))
+            return brightness
         except Exception as e:
+            self._close_sct()
             self.log(f"Error measuring brightness on monitor {monitor_id}: {e}")
             return 0
 
-    def set_overlay_opacity(self, monitor_id, opacity, force_immediate=False):
-        """Sets the overlay transparency for a specific monitor"""
+    def _measure_all(self, monitors):
+        """Measures brightness for several monitors from one virtual-desktop grab"""
+        raws = np.empty(len(monitors), dtype=np.float32)
+        if len(monitors) == 1:
+            raws[0] = self.measure_brightness(monitors[0])
+            return raws
+
+        # With the GDI downscale path each per-monitor grab transfers only a
+        # tiny bitmap, so there is nothing to gain from batching
+        if win32ui is not None:
+            try:
+                infos = self._get_sct().monitors
+                done = True
+                for k, monitor_id in enumerate(monitors):
+                    info = infos[monitor_id] if monitor_id < len(infos) else infos[1]
+                    small = self._grab_small_gdi(info)
+                    if small is None:
+                        done = False
+                        break
+                    raws[k] = _luma_bgr(small[:, :, :3])
+                if done:
+                    return raws
+            except Exception:
+                pass
+
         try:
-            opacity = max(0, min(255, int(opacity)))
-            
-            if force_immediate:
-                self.current_opacity[monitor_id] = opacity
-            elif abs(self.current_opacity.get(monitor_id, 0) - opacity) > 1:
-                self.current_opacity[monitor_id] = self.current_opacity.get(monitor_id, 0) + (opacity - self.current_opacity.get(monitor_id, 0)) * 0.3
-            else:
-                self.current_opacity[monitor_id] = opacity
-            
-            if monitor_id in self.hwnds and self.hwnds[monitor_id]:
-                win32gui.SetLayeredWindowAttributes(
-                    self.hwnds[monitor_id], 
-                    0,
-                    int(self.current_opacity[monitor_id]), 
-                    win32con.LWA_ALPHA
-                )
+            sct = self._get_sct()
+            virt = sct.monitors[0]
+            shot = sct.grab(virt)
+            img = np.frombuffer(shot.raw, dtype=np.uint8).reshape(shot.height, shot.width, 4)
+
+            if self._mon_slices is None:
+                slices = {}
+                for mid in range(1, len(sct.monitors)):
+                    m = sct.monitors[mid]
+                    x0 = m['left'] - virt['left']
+                    y0 = m['top'] - virt['top']
+                    slices[mid] = (y0, y0 + m['height'], x0, x0 + m['width'])
+                self._mon_slices = slices
+
+            for k, monitor_id in enumerate(monitors):
+                sl = self._mon_slices.get(monitor_id)
+                if sl is None:
+                    raws[k] = self.measure_brightness(monitor_id)
+                    continue
+                y0, y1, x0, x1 = sl
+                sub = img[y0:y1:SAMPLE_STRIDE, x0:x1:SAMPLE_STRIDE, :3]
+                raws[k] = _luma_bgr(sub)
         except Exception as e:
-            self.log(f"Error setting opacity: {e}")
+            self._close_sct()
+            self._mon_slices = None
+            self.log(f"Error measuring brightness (virtual grab): {e}")
+            for k, monitor_id in enumerate(monitors):
+                raws[k] = self.measure_brightness(monitor_id)
+        return raws
+
+    def set_overlay_opacity(self, monitor_id, opacity):
+        """Sets the overlay target opacity for a specific monitor.
+
+        Only the target is written; the interpolation thread is the sole
+        writer of current_opacity and window alpha and eases toward it.
+        """
+        if monitor_id >= _MAX_MONITORS:
+            return
+        self.target_opacity[monitor_id] = max(0, min(255, int(opacity)))
+
+    def _interp_loop(self):
+        """Eases current opacity toward target at ~60 Hz on its own thread.
+
+        The sampling loop only writes targets (a GIL-atomic array store), so
+        its cadence no longer gates how smooth the fade looks.
+        """
+        # Bind the per-frame state once; at 60 Hz the repeated attribute
+        # lookups are the dominant Python-side cost of this loop
+        cur = self.current_opacity
+        tgt = self.target_opacity
+        last = self._last_alpha
+        lwa_alpha = win32con.LWA_ALPHA
+        frame = 1 / 60
+        while self.running:
+            # Pause is handled here, not by the GUI thread writing
+            # current_opacity: this thread is the only writer, so a frame
+            # already in flight can't re-apply a stale alpha after pausing
+            paused = self.paused
+            for monitor_id, hwnd in list(self.hwnds.items()):
+                if not hwnd:
+                    continue
+                current = float(cur[monitor_id])
+                target = 0.0 if paused else float(tgt[monitor_id])
+                diff = target - current
+                if abs(diff) <= 1:
+                    current = target
+                else:
+                    current += diff * 0.15
+                cur[monitor_id] = current
+
+                new_alpha = int(current)
+                if new_alpha == last[monitor_id]:
+                    continue
+                try:
+                    if not _SetLayeredWindowAttributes(hwnd, 0, new_alpha, lwa_alpha):
+                        raise ctypes.WinError(ctypes.get_last_error())
+                    last[monitor_id] = new_alpha
+                except Exception as e:
+                    if DEBUG_LOGGING:
+                        self.log(f"Error setting opacity: {e}")
+            time.sleep(frame)
 
     def create_overlay(self, monitor_id):
         """Creates a transparent full-screen overlay for a specific monitor"""
@@ -100,74 +424,66 @@ class AdaptiveDimmer:
             className = f"AdaptiveDimOverlay_Mon{monitor_id}"
             
             def wndProc(hwnd, msg, wp, lp):
-                if msg == win32con.WM_PAINT:
-                    hdc, ps = win32gui.BeginPaint(hwnd)
-                    brush = win32gui.CreateSolidBrush(0x00000000)
-                    win32gui.SelectObject(hdc, brush)
-                    rect = win32gui.GetClientRect(hwnd)
-                    win32gui.FillRect(hdc, rect, brush)
-                    win32gui.DeleteObject(brush)
-                    win32gui.EndPaint(hwnd, ps)
-                    return 0
-                elif msg == win32con.WM_DESTROY:
+                # No WM_PAINT/WM_ERASEBKGND handling: the class background
+                # brush (BLACK_BRUSH) paints the solid fill and DefWindowProc
+                # validates the dirty region
+                if msg == win32con.WM_DESTROY:
                     if not self.switching_monitor:
-                        if monitor_id in self.hwnds:
-                            del self.hwnds[monitor_id]
+                        self.hwnds.pop(monitor_id, None)
+                    return 0
+                elif msg == win32con.WM_DISPLAYCHANGE:
+                    self.invalidate_monitors()
                     return 0
-                elif msg == win32con.WM_ERASEBKGND:
-                    return 1
                 elif msg == win32con.WM_CLOSE:
-                    if not self.switching_monitor and monitor_id in self.hwnds:
-                        del self.hwnds[monitor_id]
+                    if not self.switching_monitor:
+                        self.hwnds.pop(monitor_id, None)
                     win32gui.DestroyWindow(hwnd)
                     return 0
                 return win32gui.DefWindowProc(hwnd, msg, wp, lp)
             
-            wndClass = win32gui.WNDCLASS()
-            wndClass.lpfnWndProc = wndProc
-            wndClass.hInstance = hinst
-            wndClass.lpszClassName = className
-            wndClass.hCursor = win32gui.LoadCursor(0, win32con.IDC_ARROW)
-            wndClass.hbrBackground = win32gui.GetStockObject(win32con.BLACK_BRUSH)
-            
-            try:
+            if className not in _registered_classes:
+                wndClass = win32gui.WNDCLASS()
+                wndClass.lpfnWndProc = wndProc
+                wndClass.hInstance = hinst
+                wndClass.lpszClassName = className
+                # WS_EX_TRANSPARENT means the overlay never receives cursor
+                # hits, so there is no cursor to load
+                wndClass.hCursor = 0
+                wndClass.hbrBackground = win32gui.GetStockObject(win32con.BLACK_BRUSH)
                 win32gui.RegisterClass(wndClass)
-            except:
-                pass
+                self._wndprocs[monitor_id] = wndProc
+                _registered_classes.add(className)
             
             try:
-                with mss() as sct:
-                    if monitor_id < len(sct.monitors):
-                        monitor_info = sct.monitors[monitor_id]
-                    else:
-                        self.log(f"⚠️ Monitor {monitor_id} nicht gefunden")
-                        return
-                    
-                    monitor_left = monitor_info['left']
-                    monitor_top = monitor_info['top']
-                    screen_width = monitor_info['width']
-                    screen_height = monitor_info['height']
-                    
+                monitor_info = self._get_monitor_info(monitor_id)
+                if monitor_info is None:
+                    self.log(f"⚠️ Monitor {monitor_id} nicht gefunden")
+                    return
+
+                monitor_left = monitor_info['left']
+                monitor_top = monitor_info['top']
+                screen_width = monitor_info['width']
+                screen_height = monitor_info['height']
+
+                if DEBUG_LOGGING:
                     self.log(f"DEBUG create_overlay: Monitor {monitor_id} - left={monitor_left}, top={monitor_top}, width={screen_width}, height={screen_height}")
             except Exception as e:
                 self.log(f"Fehler beim Lesen der Monitor-Info: {e}")
                 return
 
-            if monitor_id in self.hwnds and self.hwnds[monitor_id]:
+            old_hwnd = self.hwnds.get(monitor_id)
+            if old_hwnd:
                 try:
-                    win32gui.DestroyWindow(self.hwnds[monitor_id])
+                    win32gui.DestroyWindow(old_hwnd)
                 except:
                     pass
                 self.hwnds[monitor_id] = None
             
             hwnd = win32gui.CreateWindowEx(
-                win32con.WS_EX_LAYERED | 
-                win32con.WS_EX_TRANSPARENT | 
-                win32con.WS_EX_TOPMOST | 
-                win32con.WS_EX_NOACTIVATE,
+                _OVERLAY_EX,
                 className,
                 "",
-                win32con.WS_POPUP | win32con.WS_VISIBLE,
+                _OVERLAY_STYLE,
                 monitor_left - 1, monitor_top - 1,
                 screen_width + 2, screen_height + 2,
                 None, None, hinst, None
@@ -179,8 +495,15 @@ class AdaptiveDimmer:
             self.hwnds[monitor_id] = hwnd
             self.current_opacity[monitor_id] = 0
             self.target_opacity[monitor_id] = 0
-            
+            # Drop the settle-skip history along with the opacity state: the
+            # rebuilt overlay starts transparent, and on a static screen a
+            # stale last-brightness entry would keep the loop skipping the
+            # recommand forever
+            self._last_brightness.pop(monitor_id, None)
+            self._last_commanded.pop(monitor_id, None)
+
             win32gui.SetLayeredWindowAttributes(hwnd, 0, 0, win32con.LWA_ALPHA)
+            self._last_alpha[monitor_id] = 0
             win32gui.ShowWindow(hwnd, win32con.SW_SHOWNOACTIVATE)
             win32gui.UpdateWindow(hwnd)
             
@@ -189,62 +512,160 @@ class AdaptiveDimmer:
                 win32con.HWND_TOPMOST,
                 monitor_left - 1, monitor_top - 1,
                 screen_width + 2, screen_height + 2,
-                win32con.SWP_NOACTIVATE | win32con.SWP_SHOWWINDOW
+                _SWP_FLAGS
             )
-            
-            win32gui.MoveWindow(hwnd, monitor_left - 1, monitor_top - 1, screen_width + 2, screen_height + 2, True)
+
             self.log(f"Overlay erstellt für Monitor {monitor_id}: {screen_width}x{screen_height} @ ({monitor_left},{monitor_top})")
             
         except Exception as e:
             self.log(f"ERROR: Overlay konnte nicht erstellt werden: {e}")
 
+    def apply_monitors(self, new_monitors):
+        """Switches the active monitor set, touching only the changed overlays"""
+        removed = []
+        added = []
+        with self.monitor_lock:
+            old_monitors = self.active_monitors
+            if old_monitors == new_monitors:
+                return
+            removed = [m for m in old_monitors if m not in new_monitors]
+            added = [m for m in new_monitors if m not in old_monitors]
+            self.switching_monitor = True
+            try:
+                for monitor_id in removed:
+                    hwnd = self.hwnds.pop(monitor_id, None)
+                    if hwnd:
+                        try:
+                            win32gui.DestroyWindow(hwnd)
+                        except Exception as e:
+                            self.log(f"Fehler beim Löschen des Overlays für Monitor {monitor_id}: {e}")
+                    self.current_opacity[monitor_id] = 0
+                    self.target_opacity[monitor_id] = 0
+
+                for monitor_id in added:
+                    try:
+                        self.create_overlay(monitor_id)
+                    except Exception as e:
+                        self.log(f"Fehler beim Erstellen des Overlays für Monitor {monitor_id}: {e}")
+
+                self.active_monitors = new_monitors
+            finally:
+                self.switching_monitor = False
+        self.log(f"Overlays angepasst: -{removed} +{added}")
+
     def monitor_loop(self):
         """Main loop for brightness monitoring"""
-        last_print = time.time()
-        
+        # One clock for everything: perf_counter is monotonic (time.time can
+        # jump on NTP/DST adjustments) and is read once per tick
+        last_print = next_tick = time.perf_counter()
+
         try:
             while self.running:
                 if self.paused:
                     time.sleep(CHECK_INTERVAL)
+                    next_tick = time.perf_counter()
                     continue
-                
+
+                # A display change invalidated the capture geometry: drop the
+                # cached mss instance so the next grab re-reads the rects
+                if self._geometry_dirty:
+                    self._geometry_dirty = False
+                    self._close_sct()
+
+                # Only snapshot shared state under the lock; the expensive
+                # capture and reduction run without blocking the GUI thread
                 with self.monitor_lock:
                     if not self.running:
                         break
-                    
-                    for monitor_id in self.active_monitors:
-                        brightness = self.measure_brightness(monitor_id)
-                        
-                        if brightness > THRESHOLD_MAX:
-                            self.target_opacity[monitor_id] = MAX_OPACITY
-                        elif brightness > THRESHOLD_START:
-                            ratio = (brightness - THRESHOLD_START) / (THRESHOLD_MAX - THRESHOLD_START)
-                            self.target_opacity[monitor_id] = ratio * MAX_OPACITY
-                        else:
-                            self.target_opacity[monitor_id] = 0
-                        
-                        self.set_overlay_opacity(monitor_id, self.target_opacity[monitor_id])
-                
-                if time.time() - last_print >= 2.0:
-                    for monitor_id in self.active_monitors:
-                        brightness = self.measure_brightness(monitor_id)
-                        opacity = self.current_opacity.get(monitor_id, 0)
-                        status = "🔴 AKTIV" if self.target_opacity.get(monitor_id, 0) > 5 else "⚫ AUS"
-                        self.log(f"Monitor {monitor_id}: {status} | Helligkeit: {brightness:.1f} | Abdunkelung: {opacity:.1f}/255")
-                    if self.gui:
-                        brightness = self.measure_brightness(self.active_monitors[0])
-                        opacity = self.current_opacity.get(self.active_monitors[0], 0)
-                        self.gui.update_status(f"Helligkeit: {brightness:.1f}", opacity)
-                    last_print = time.time()
+                    monitors = list(self.active_monitors)
+
+                raws = self._measure_all(monitors)
+
+                # Table lookup replaces the clipped-linear arithmetic; the
+                # sub-unit brightness precision it discards is below the
+                # 1-unit dead-band anyway
+                targets = _OPACITY_LUT[
+                    np.clip(np.rint(raws), 0, 255).astype(np.intp)
+                ]
+
+                max_delta = 0.0
+                for k, monitor_id in enumerate(monitors):
+                    brightness = float(raws[k])
+                    current = float(self.current_opacity[monitor_id])
+
+                    # Static scene and overlay already settled: nothing to do
+                    last = self._last_brightness.get(monitor_id)
+                    delta = abs(brightness - last) if last is not None else float('inf')
+                    if delta > max_delta:
+                        max_delta = delta
+                    if (last is not None and delta < 0.5
+                            and abs(current - float(self.target_opacity[monitor_id])) < 1):
+                        continue
+                    self._last_brightness[monitor_id] = brightness
+
+                    # Dead-band: don't re-command an opacity the overlay has
+                    # already been driven to
+                    new_target = float(targets[k])
+                    prev = self._last_commanded.get(monitor_id)
+                    if (prev is not None and abs(new_target - prev) < 1.0
+                            and abs(current - new_target) < 1):
+                        continue
+                    self._last_commanded[monitor_id] = new_target
+
+                    self.target_opacity[monitor_id] = new_target
                 
-                time.sleep(CHECK_INTERVAL)
-        
+                now = time.perf_counter()
+                if now - last_print >= 2.0:
+                    # Reuse this tick's measurements instead of grabbing again,
+                    # and emit the whole block as one log call
+                    lines = []
+                    for k, monitor_id in enumerate(monitors):
+                        opacity = float(self.current_opacity[monitor_id])
+                        status = "🔴 AKTIV" if self.target_opacity[monitor_id] > 5 else "⚫ AUS"
+                        prefix = self._status_prefix.get(monitor_id)
+                        if prefix is None:
+                            prefix = self._status_prefix[monitor_id] = f"Monitor {monitor_id}: "
+                        lines.append(f"{prefix}{status} | Helligkeit: {raws[k]:.1f} | Abdunkelung: {opacity:.1f}/255")
+                    self.log("\n".join(lines))
+                    self.latest_status = (
+                        f"Helligkeit: {raws[0]:.1f}",
+                        float(self.current_opacity[monitors[0]])
+                    )
+                    last_print = now
+
+                # Back off sampling while the scene is stable; snap back to
+                # the fast cadence on any real brightness change
+                if max_delta < 2.0:
+                    self._interval = min(0.5, self._interval * 1.1)
+                else:
+                    self._interval = CHECK_INTERVAL
+
+                # Absolute deadline keeps a stable cadence instead of
+                # drifting by work time + sleep granularity each tick
+                next_tick += self._interval
+                delay = next_tick - now
+                if delay > 0:
+                    time.sleep(delay)
+                else:
+                    next_tick = now
+
         except KeyboardInterrupt:
             self.log("\nProgramm wird beendet...")
             self.running = False
+        finally:
+            self._release_gdi()
+            self._close_sct()
 
     def run(self):
         """Starts the dimmer"""
+        timer_period_set = False
+        try:
+            # Windows sleeps are only ~15.6 ms accurate by default
+            ctypes.windll.winmm.timeBeginPeriod(1)
+            timer_period_set = True
+        except Exception:
+            pass
+
         self.log("=" * 50)
         self.log("ADAPTIVE SCREEN DIMMING v2 - GUI")
         self.log("=" * 50)
@@ -254,21 +675,42 @@ class AdaptiveDimmer:
         self.log(f"Check Interval: {CHECK_INTERVAL}s")
         self.log(f"Aktive Bildschirme: {self.active_monitors}")
         self.log("")
-        
+
+        try:
+            # Warm the JIT so the first real tick isn't penalized by
+            # compilation. Numba specializes on contiguity and mutability, so
+            # the warmup inputs must match the real call sites: a writable
+            # strided view (mss grab + stride sampling) and a readonly
+            # strided view (frombuffer over the GetBitmapBits bytes)
+            warm = np.zeros((16, 16, 4), dtype=np.uint8)
+            _luma_bgr(warm[::SAMPLE_STRIDE, ::SAMPLE_STRIDE, :3])
+            warm_ro = np.frombuffer(bytes(16 * 16 * 4), dtype=np.uint8)
+            _luma_bgr(warm_ro.reshape(16, 16, 4)[:, :, :3])
+        except Exception:
+            pass
+
         for monitor_id in self.active_monitors:
             self.create_overlay(monitor_id)
 
         monitor_thread = threading.Thread(target=self.monitor_loop, daemon=True)
         monitor_thread.start()
 
+        interp_thread = threading.Thread(target=self._interp_loop, daemon=True)
+        interp_thread.start()
+
         try:
             while self.running:
+                # Sleep until a window message actually arrives; the 100 ms
+                # timeout only exists to re-check self.running
+                win32event.MsgWaitForMultipleObjects(
+                    [], 0, 100, win32con.QS_ALLINPUT)
                 win32gui.PumpWaitingMessages()
-                time.sleep(0.01)
         except KeyboardInterrupt:
             self.log("\nProgramm wird beendet...")
             self.running = False
-            for hwnd in self.hwnds.values():
+            with self.monitor_lock:
+                hwnds = list(self.hwnds.values())
+            for hwnd in hwnds:
                 if hwnd:
                     win32gui.PostMessage(hwnd, win32con.WM_CLOSE, 0, 0)
         except Exception as e:
@@ -276,16 +718,37 @@ class AdaptiveDimmer:
             self.running = False
         finally:
             monitor_thread.join(timeout=1)
-            for monitor_id in list(self.hwnds.keys()):
-                if self.hwnds[monitor_id]:
+            interp_thread.join(timeout=1)
+            if timer_period_set:
+                try:
+                    ctypes.windll.winmm.timeEndPeriod(1)
+                except Exception:
+                    pass
+            # Snapshot under the lock so a late mode switch can't mutate the
+            # dict mid-iteration
+            with self.monitor_lock:
+                hwnds = list(self.hwnds.values())
+            for hwnd in hwnds:
+                if hwnd:
                     try:
-                        win32gui.DestroyWindow(self.hwnds[monitor_id])
+                        win32gui.DestroyWindow(hwnd)
                     except Exception:
                         pass
             self.log("✓ Overlay geschlossen")
+            # The writer is a daemon thread; without draining it here the
+            # shutdown messages can be dropped at process exit
+            self.close_log()
 
 
 class DimmerGUI:
+    # Mode label -> monitor ids, resolved once instead of re-branching on
+    # every selection change
+    MODE_MONITORS = {
+        "Nur Monitor 1": [1],
+        "Nur Monitor 2": [2],
+        "Beide Bildschirme": [1, 2],
+    }
+
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("Adaptive Screen Dimmer")
@@ -296,6 +759,8 @@ class DimmerGUI:
         self.dimmer = None
         self.dimmer_thread = None
         self.active = False
+        self._log_queue = queue.Queue()
+        self._run_state = None
         
         self.root.configure(bg="#2b2b2b")
         
@@ -329,7 +794,7 @@ class DimmerGUI:
         monitor_label.pack(side=tk.LEFT, padx=5, pady=5)
         
         self.mode_var = tk.StringVar(value="Nur Monitor 1")
-        self.mode_modes = ["Nur Monitor 1", "Nur Monitor 2", "Beide Bildschirme"]
+        self.mode_modes = list(self.MODE_MONITORS)
         self.mode_combo = ttk.Combobox(
             monitor_frame,
             textvariable=self.mode_var,
@@ -409,83 +874,56 @@ class DimmerGUI:
         self.resume_button.pack(side=tk.LEFT, padx=5)
         
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
-        self.root.after(500, self.auto_start)
-        
+        # Start as soon as the event loop is up; nothing here needs half a
+        # second of settling time
+        self.root.after(0, self.auto_start)
+        self.root.after(100, self._drain_logs)
+
     def add_log(self, message):
-        """Add message to log"""
-        self.log_text.config(state=tk.NORMAL)
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_text.insert(tk.END, f"[{timestamp}] {message}\n")
-        self.log_text.see(tk.END)
-        self.log_text.config(state=tk.DISABLED)
-    
+        """Queue a log line; safe to call from any thread"""
+        self._log_queue.put_nowait(message)
+
+    def _drain_logs(self):
+        """Flushes queued log lines into the text widget in one batch"""
+        lines = []
+        while True:
+            try:
+                lines.append(self._log_queue.get_nowait())
+            except queue.Empty:
+                break
+        if lines:
+            timestamp = datetime.now().strftime("%H:%M:%S")
+            text = "".join(f"[{timestamp}] {line}\n" for line in lines)
+            self.log_text.config(state=tk.NORMAL)
+            self.log_text.insert(tk.END, text)
+            self.log_text.see(tk.END)
+            self.log_text.config(state=tk.DISABLED)
+        # Poll quickly only while messages are flowing; idle GUIs don't need
+        # wakeups every 100 ms
+        self.root.after(50 if lines else 250, self._drain_logs)
+
     def update_status(self, brightness_text, opacity):
         """Update status label"""
-        opacity_pct = (opacity / 255) * 100
+        opacity_pct = opacity * _INV255 * 100.0
         pause_info = " (⏸ PAUSIERT)" if self.dimmer and self.dimmer.paused else ""
         self.status_label.config(text=f"{brightness_text} | Abdunkelung: {opacity_pct:.0f}%{pause_info}")
     
     def on_mode_change(self, event=None):
         """Handle mode selection change"""
         if self.active and self.dimmer:
-            mode = self.mode_var.get()
-            
-            if mode == "Nur Monitor 1":
-                new_monitors = [1]
-            elif mode == "Nur Monitor 2":
-                new_monitors = [2]
-            else:
-                new_monitors = [1, 2]
-            
+            new_monitors = self.MODE_MONITORS.get(self.mode_var.get(), [1, 2])
             old_monitors = self.dimmer.active_monitors
-            
+
             if old_monitors == new_monitors:
                 return
-            
+
             self.add_log(f"⚡ Modus gewechselt: {old_monitors} → {new_monitors}")
-            
-            with self.dimmer.monitor_lock:
-                self.dimmer.switching_monitor = True
-                
-                try:
-                    for monitor_id in old_monitors:
-                        if monitor_id not in new_monitors and monitor_id in self.dimmer.hwnds:
-                            try:
-                                if self.dimmer.hwnds[monitor_id]:
-                                    win32gui.DestroyWindow(self.dimmer.hwnds[monitor_id])
-                                    del self.dimmer.hwnds[monitor_id]
-                                    if monitor_id in self.dimmer.current_opacity:
-                                        del self.dimmer.current_opacity[monitor_id]
-                                    if monitor_id in self.dimmer.target_opacity:
-                                        del self.dimmer.target_opacity[monitor_id]
-                            except Exception as e:
-                                self.add_log(f"Fehler beim Löschen des Overlays für Monitor {monitor_id}: {e}")
-                    
-                    time.sleep(0.1)
-                    
-                    for monitor_id in new_monitors:
-                        if monitor_id not in old_monitors:
-                            try:
-                                self.dimmer.create_overlay(monitor_id)
-                            except Exception as e:
-                                self.add_log(f"Fehler beim Erstellen des Overlays für Monitor {monitor_id}: {e}")
-                    
-                    self.dimmer.active_monitors = new_monitors
-                finally:
-                    self.dimmer.switching_monitor = False
+            self.dimmer.apply_monitors(new_monitors)
     
     def auto_start(self):
         """Auto-start the dimmer on startup"""
         self.add_log("Auto-Start: Abdunkler wird gestartet...")
-        mode = self.mode_var.get()
-        
-        if mode == "Nur Monitor 1":
-            active_monitors = [1]
-        elif mode == "Nur Monitor 2":
-            active_monitors = [2]
-        else:
-            active_monitors = [1, 2]
-        
+        active_monitors = self.MODE_MONITORS.get(self.mode_var.get(), [1, 2])
         self.add_log(f"Starte Abdunkler für Bildschirme: {active_monitors}...")
         self.active = True
         
@@ -495,26 +933,44 @@ class DimmerGUI:
         self.dimmer_thread = threading.Thread(target=self.dimmer.run, daemon=True)
         self.dimmer_thread.start()
         
-        self.pause_button.config(state=tk.NORMAL)
-        self.resume_button.config(state=tk.DISABLED)
+        self._set_run_state("running")
         self.mode_combo.config(state="readonly")
-        self.status_label.config(text="🔴 LÄUFT", fg="#00ff00")
         self.add_log("✓ Abdunkler gestartet!")
+        self.root.after(500, self._poll_status)
+
+    def _set_run_state(self, state):
+        """Applies button/status widget changes, skipping redundant Tcl calls"""
+        if self._run_state == state:
+            return
+        self._run_state = state
+        if state == "paused":
+            self.pause_button.config(state=tk.DISABLED)
+            self.resume_button.config(state=tk.NORMAL)
+            self.status_label.config(text="⏸ PAUSIERT (0%)", fg="#ff7700")
+        else:
+            self.pause_button.config(state=tk.NORMAL)
+            self.resume_button.config(state=tk.DISABLED)
+            self.status_label.config(text="🔴 LÄUFT", fg="#00ff00")
+
+    def _poll_status(self):
+        """Pull the latest status snapshot from the dimmer thread"""
+        if self.active and self.dimmer:
+            status = self.dimmer.latest_status
+            if status is not None:
+                self.update_status(*status)
+        self.root.after(500, self._poll_status)
     
     def pause_dimmer(self):
         """Pause the dimmer"""
         if not self.active or not self.dimmer:
             return
         
+        # The interpolation thread sees the flag and eases the overlays to
+        # fully transparent itself; writing opacity state from this thread
+        # would race it
         self.dimmer.paused = True
-        for monitor_id in self.dimmer.active_monitors:
-            self.dimmer.target_opacity[monitor_id] = 0
-            self.dimmer.set_overlay_opacity(monitor_id, 0, force_immediate=True)
         self.add_log("⏸ Abdunkler pausiert - Abdunkelung: 0/255")
-        
-        self.pause_button.config(state=tk.DISABLED)
-        self.resume_button.config(state=tk.NORMAL)
-        self.status_label.config(text="⏸ PAUSIERT (0%)", fg="#ff7700")
+        self._set_run_state("paused")
     
     def resume_dimmer(self):
         """Resume the dimmer"""
@@ -523,17 +979,16 @@ class DimmerGUI:
         
         self.dimmer.paused = False
         self.add_log("▶ Abdunkler fortgesetzt")
-        
-        self.pause_button.config(state=tk.NORMAL)
-        self.resume_button.config(state=tk.DISABLED)
-        self.status_label.config(text="🔴 LÄUFT", fg="#00ff00")
+        self._set_run_state("running")
     
     def on_closing(self):
         """Handle window close"""
         if self.active and self.dimmer:
             self.add_log("Beende Abdunkler...")
             self.dimmer.running = False
-            for hwnd in self.dimmer.hwnds.values():
+            with self.dimmer.monitor_lock:
+                hwnds = list(self.dimmer.hwnds.values())
+            for hwnd in hwnds:
                 if hwnd:
                     try:
                         win32gui.PostMessage(hwnd, win32con.WM_CLOSE, 0, 0)
@@ -542,12 +997,15 @@ class DimmerGUI:
         
         if self.dimmer_thread and self.dimmer_thread.is_alive():
             self.dimmer_thread.join(timeout=2)
-        
+        if self.dimmer:
+            self.dimmer.close_log()
+
         self.root.destroy()
 
 
 def main():
-    print("🔍 DEBUG: main() started")
+    if DEBUG_LOGGING:
+        print("🔍 DEBUG: main() started")
     try:
         try:
             ctypes.windll.user32.SetProcessDPIAware()
@@ -560,25 +1018,25 @@ def main():
     except:
         pass
     
-    print("🔍 DEBUG: Creating DimmerGUI...")
+    if DEBUG_LOGGING:
+        print("🔍 DEBUG: Creating DimmerGUI...")
     try:
         gui = DimmerGUI()
-        print("🔍 DEBUG: DimmerGUI created successfully")
-        print("🔍 DEBUG: Starting mainloop...")
+        if DEBUG_LOGGING:
+            print("🔍 DEBUG: DimmerGUI created successfully")
+            print("🔍 DEBUG: Starting mainloop...")
         gui.root.mainloop()
-        print("🔍 DEBUG: mainloop ended")
+        if DEBUG_LOGGING:
+            print("🔍 DEBUG: mainloop ended")
     except Exception as e:
-        print(f"❌ ERROR in GUI creation: {e}")
-        import traceback
-        traceback.print_exc()
+        # One formatted write instead of separate print + print_exc calls
+        sys.stderr.write(f"❌ ERROR in GUI creation: {e}\n{traceback.format_exc()}")
 
 
 if __name__ == "__main__":
     try:
         main()
     except Exception as e:
-        print(f"\n\nCRITICAL ERROR: {e}")
-        import traceback
-        traceback.print_exc()
+        sys.stderr.write(f"\n\nCRITICAL ERROR: {e}\n{traceback.format_exc()}")
         time.sleep(3)
         sys.exit(1)